@@ -6,48 +6,308 @@ A tool to convert DOCX files to Markdown format using Pandoc.
 """
 
 import os
+import re
 import sys
+import json
+import time
+import base64
+import shutil
+import socket
+import hashlib
 import argparse
+import functools
 import subprocess
+import http.client
+import urllib.error
+import urllib.request
 from pathlib import Path
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QPushButton, QFileDialog, QListWidget, QProgressBar,
                              QLineEdit, QFormLayout, QGroupBox, QMessageBox, QSizePolicy,
-                             QAbstractItemView)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize
+                             QAbstractItemView, QCheckBox)
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QSize
+
+# Common spellings of the DOCX extension, checked without building a lowercased copy
+_DOCX_SUFFIXES = ('.docx', '.DOCX', '.Docx')
+
+
+def _is_docx(path):
+    """Return True if path has a .docx extension, in any case."""
+    # Only unusual spellings like '.DocX' pay for the slice and lower()
+    return path.endswith(_DOCX_SUFFIXES) or path[-5:].lower() == '.docx'
+
+
+def _markdown_path(path):
+    """Return path with its extension replaced by .md."""
+    if _is_docx(path):
+        return path[:-5] + '.md'
+    return os.path.splitext(path)[0] + '.md'
+
+
+def _path_key(path):
+    """Return a normalized form of path for telling whether two paths are the same file."""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _args_sidecar_path(output_file):
+    """Return the hidden file recording the extra Pandoc arguments output_file was built with."""
+    directory, filename = os.path.split(output_file)
+    return os.path.join(directory, '.' + filename + '.pandoc-args')
+
+
+def _args_digest(extra_args):
+    """Return a digest of extra Pandoc arguments, or '' if there are none."""
+    if not extra_args:
+        return ''
+    return hashlib.sha256('\0'.join(extra_args).encode('utf-8')).hexdigest()
+
+
+# Outcomes reported for each file in a batch
+CONVERTED = 'converted'
+UP_TO_DATE = 'up to date'
+FAILED = 'failed'
+
+
+# The `pandoc server` subcommand first shipped with Pandoc 3.0 (2.18 and 2.19
+# only had a separate `pandoc-server` binary)
+PANDOC_SERVER_MIN_VERSION = (3, 0)
+
+# Seconds to wait for the Pandoc server to start accepting connections
+PANDOC_SERVER_STARTUP_TIMEOUT = 5
+
+# Seconds the Pandoc server may spend on one conversion (its own default is
+# only 2, which large documents exceed)
+PANDOC_SERVER_CONVERSION_TIMEOUT = 600
+
+
+@functools.lru_cache(maxsize=None)
+def _check_pandoc():
+    """
+    Check if Pandoc is installed and accessible.
+    
+    The result is cached for the life of the process, so building several
+    converters only locates and runs Pandoc once. Failures aren't cached.
+    
+    Returns:
+        tuple: (path, version) where path is the absolute path to the Pandoc
+            executable and version is e.g. (3, 1, 2), or () if it can't be parsed
+    """
+    pandoc = shutil.which('pandoc')
+    if pandoc is None:
+        raise Exception("Pandoc not found. Please install Pandoc: https://pandoc.org/installing.html")
+    
+    try:
+        result = subprocess.run([pandoc, '--version'], 
+                               stdout=subprocess.PIPE, 
+                               stderr=subprocess.PIPE, 
+                               text=True)
+        if result.returncode != 0:
+            raise Exception("Pandoc is installed but not working properly.")
+    except FileNotFoundError:
+        raise Exception("Pandoc not found. Please install Pandoc: https://pandoc.org/installing.html")
+    
+    match = re.match(r'pandoc(?:\.exe)? ([\d.]+)', result.stdout)
+    if not match:
+        return pandoc, ()
+    return pandoc, tuple(int(part) for part in match.group(1).split('.') if part)
+
 
 class DocxToMarkdownConverter:
     """Handles conversion of DOCX files to Markdown using Pandoc."""
     
-    def __init__(self):
-        """Initialize the converter."""
-        self._check_pandoc()
+    def __init__(self, use_server=False):
+        """
+        Initialize the converter.
+        
+        Args:
+            use_server (bool, optional): Convert through a persistent `pandoc server`
+                process. Off by default: the server listens on every network
+                interface and can't be restricted to localhost.
+        """
+        self._server = None
+        self._server_url = None
+        self._opener = None
+        self._pandoc, self._pandoc_version = _check_pandoc()
+        if use_server:
+            self._start_server()
     
-    def _check_pandoc(self):
-        """Check if Pandoc is installed and accessible."""
+    def __del__(self):
+        self.close()
+    
+    def _start_server(self):
+        """
+        Start a long-lived `pandoc server` process to convert files through.
+        
+        Spawning Pandoc for every file costs more than converting a small
+        document, so when the installed Pandoc supports it we keep one server
+        running and send it conversion requests over HTTP instead. If the
+        server can't be started, conversions use the command-line path.
+        
+        `pandoc server` has no option to choose the interface it binds to, so
+        while it runs, anyone who can reach this machine can use it to convert
+        documents. That's why it's only started on request.
+        """
+        if self._pandoc_version < PANDOC_SERVER_MIN_VERSION:
+            return
+        
+        # Ask the OS for a free port
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        
         try:
-            result = subprocess.run(['pandoc', '--version'], 
-                                   stdout=subprocess.PIPE, 
-                                   stderr=subprocess.PIPE, 
-                                   text=True)
-            if result.returncode != 0:
-                raise Exception("Pandoc is installed but not working properly.")
-        except FileNotFoundError:
-            raise Exception("Pandoc not found. Please install Pandoc: https://pandoc.org/installing.html")
+            self._server = subprocess.Popen([self._pandoc, 'server', '--port', str(port),
+                                             '--timeout', str(PANDOC_SERVER_CONVERSION_TIMEOUT)],
+                                            stdin=subprocess.DEVNULL,
+                                            stdout=subprocess.DEVNULL,
+                                            stderr=subprocess.DEVNULL)
+        except OSError:
+            return
+        
+        # Wait for the server to accept connections
+        deadline = time.monotonic() + PANDOC_SERVER_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self._server.poll() is not None:
+                # This Pandoc build doesn't include the server
+                self._server = None
+                return
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+            except OSError:
+                time.sleep(0.05)
+                continue
+            break
+        else:
+            self.close()
+            return
+        
+        # Talk to the server directly: urlopen would otherwise route requests
+        # (and document contents) through any http_proxy in the environment
+        self._opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+        
+        # Accepting connections isn't enough: some builds accept and then reset
+        # every request, so confirm with a tiny real conversion
+        url = f"http://127.0.0.1:{port}/"
+        try:
+            result = self._post_to_server(url, {'text': '# ok', 'from': 'markdown', 'to': 'markdown'},
+                                          timeout=PANDOC_SERVER_STARTUP_TIMEOUT)
+        except (OSError, http.client.HTTPException, ValueError):
+            result = None
+        
+        if isinstance(result, dict) and isinstance(result.get('output'), str):
+            self._server_url = url
+        else:
+            self.close()
     
-    def convert_file(self, input_file, output_file=None, extra_args=None):
+    def close(self):
+        """Shut down the Pandoc server, if one is running."""
+        server = getattr(self, '_server', None)
+        self._server = None
+        self._server_url = None
+        
+        if server is not None and server.poll() is None:
+            server.terminate()
+            try:
+                server.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                server.kill()
+    
+    def _post_to_server(self, url, params, timeout):
+        """
+        Send one conversion request to the Pandoc server.
+        
+        Returns:
+            The decoded JSON response
+            
+        Raises:
+            OSError: If the request fails (urllib.error.HTTPError if the server
+                answered with an error status)
+            http.client.HTTPException: If the reply is malformed or cut short
+            ValueError: If the response isn't valid JSON
+        """
+        request = urllib.request.Request(url, data=json.dumps(params).encode('utf-8'), headers={
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+        })
+        
+        with self._opener.open(request, timeout=timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+    
+    def _convert_with_server(self, input_file, output_file):
+        """
+        Convert a single DOCX file through the Pandoc server.
+        
+        Returns:
+            bool: True if conversion was successful, False otherwise
+        """
+        server_url = self._server_url
+        if not server_url:
+            return False
+        
+        try:
+            with open(input_file, 'rb') as f:
+                text = base64.b64encode(f.read()).decode('ascii')
+        except OSError:
+            return False
+        
+        params = {
+            'text': text,
+            'from': 'docx',
+            'to': 'markdown',
+            'wrap': 'none',
+        }
+        
+        try:
+            # Allow a little longer than the server's own limit, so its timeout
+            # error arrives first, but never block a pool thread forever
+            result = self._post_to_server(server_url, params,
+                                          timeout=PANDOC_SERVER_CONVERSION_TIMEOUT + 30)
+        except urllib.error.HTTPError:
+            # The server is up but couldn't convert this file
+            return False
+        except (OSError, http.client.HTTPException):
+            # The connection itself failed, or the reply was garbled or cut
+            # short; stop sending files to the server rather than paying a
+            # failed round-trip for each one
+            self._server_url = None
+            return False
+        except ValueError:
+            return False
+        
+        output = result.get('output') if isinstance(result, dict) else None
+        if not isinstance(output, str) or result.get('base64'):
+            return False
+        
+        # Match the command-line output, which always ends with a newline
+        if not output.endswith('\n'):
+            output += '\n'
+        
+        try:
+            with open(output_file, 'w', encoding='utf-8', newline='') as f:
+                f.write(output)
+        except OSError:
+            return False
+        
+        return True
+    
+    def convert_file(self, input_file, output_file=None, extra_args=None, force=False):
         """
         Convert a single DOCX file to Markdown.
         
+        Files whose output is already newer than the input, and was built with
+        the same extra arguments, are skipped unless force is set.
+        
         Args:
             input_file (str): Path to the input DOCX file
             output_file (str, optional): Path to the output Markdown file
             extra_args (list, optional): Additional arguments to pass to Pandoc
+            force (bool, optional): Convert even if the output is up to date
             
         Returns:
-            bool: True if conversion was successful, False otherwise
+            bool: True if conversion was successful or skipped, False otherwise
         """
         if not os.path.exists(input_file):
             print(f"Error: File not found: {input_file}")
@@ -55,21 +315,94 @@ class DocxToMarkdownConverter:
             
         if not output_file:
             # Create output filename by replacing .docx with .md
-            output_file = os.path.splitext(input_file)[0] + '.md'
+            output_file = _markdown_path(input_file)
+        
+        args_digest = _args_digest(extra_args)
+        if not force and self._is_up_to_date(input_file, output_file, args_digest):
+            return True
+        
+        if not self._run_pandoc(input_file, output_file, extra_args):
+            return False
+        
+        self._record_args(output_file, args_digest)
+        return True
+    
+    def convert_if_needed(self, input_file, output_file, extra_args=None, force=False):
+        """
+        Convert a single DOCX file unless its output is already up to date.
+        
+        Like convert_file, but tells a skipped file apart from a converted one
+        so batches can report them separately.
+        
+        Returns:
+            str: CONVERTED, UP_TO_DATE or FAILED
+        """
+        if not force and self._is_up_to_date(input_file, output_file, _args_digest(extra_args)):
+            return UP_TO_DATE
+        
+        if self.convert_file(input_file, output_file, extra_args, force=True):
+            return CONVERTED
+        return FAILED
+    
+    def _is_up_to_date(self, input_file, output_file, args_digest):
+        """Return True if output_file is newer than input_file and used the same arguments."""
+        try:
+            if os.stat(output_file).st_mtime < os.stat(input_file).st_mtime:
+                return False
+        except OSError:
+            return False
+        
+        # No sidecar means the output was built without extra arguments
+        try:
+            with open(_args_sidecar_path(output_file), encoding='utf-8') as f:
+                recorded = f.read().strip()
+        except OSError:
+            recorded = ''
         
-        cmd = ['pandoc', input_file, '-o', output_file, '--wrap=none']
+        return recorded == args_digest
+    
+    def _record_args(self, output_file, args_digest):
+        """Record the extra arguments output_file was built with, for _is_up_to_date."""
+        sidecar = _args_sidecar_path(output_file)
+        try:
+            if args_digest:
+                with open(sidecar, 'w', encoding='utf-8') as f:
+                    f.write(args_digest)
+            elif os.path.exists(sidecar):
+                os.remove(sidecar)
+        except OSError:
+            # Without a record the file is just reconverted next time
+            pass
+    
+    def _run_pandoc(self, input_file, output_file, extra_args=None):
+        """
+        Run Pandoc on a single file, through the server when possible.
+        
+        Returns:
+            bool: True if conversion was successful, False otherwise
+        """
+        # The server only takes structured options, so extra Pandoc arguments
+        # and non-Markdown outputs go through the command line. If the server
+        # fails, retry on the command line too so its error is reported.
+        if self._server_url and not extra_args and output_file.endswith('.md'):
+            if self._convert_with_server(input_file, output_file):
+                return True
+        
+        cmd = [self._pandoc, input_file, '-o', output_file, '--wrap=none']
         
         if extra_args:
             cmd.extend(extra_args)
         
         try:
+            # Output goes to a file, so stdout is discarded and only stderr
+            # is kept, decoded just when there's an error to report
             result = subprocess.run(cmd, 
-                                   stdout=subprocess.PIPE, 
-                                   stderr=subprocess.PIPE, 
-                                   text=True)
+                                   stdout=subprocess.DEVNULL, 
+                                   stderr=subprocess.PIPE)
             
             if result.returncode != 0:
-                print(f"Error converting {input_file}: {result.stderr}")
+                stderr = result.stderr.decode('utf-8', errors='replace')
+                print(f"Error converting {input_file}: {stderr}")
                 return False
                 
             return True
@@ -77,7 +410,107 @@ class DocxToMarkdownConverter:
             print(f"Exception while converting {input_file}: {str(e)}")
             return False
     
-    def batch_convert(self, input_files, output_dir=None, extra_args=None):
+    def output_path(self, input_file, output_dir=None):
+        """Return the Markdown output path for input_file."""
+        if not output_dir:
+            # Next to the input file, replacing .docx with .md
+            return _markdown_path(input_file)
+        
+        # Create output filename in the specified directory
+        filename = os.path.basename(input_file)
+        return os.path.join(output_dir, _markdown_path(filename))
+    
+    def plan_outputs(self, input_files, output_dir=None):
+        """
+        Work out the output path for each input file, rejecting clashes.
+        
+        Files are converted in parallel, so two inputs with the same output
+        path (e.g. same-named files from different folders sent to one output
+        directory) would race to write it. The first input keeps the path and
+        the rest are reported as conflicts. An input listed more than once is
+        only converted once.
+        
+        Args:
+            input_files (list): List of paths to input DOCX files
+            output_dir (str, optional): Directory to save output files
+            
+        Returns:
+            tuple: (jobs, conflicts) where jobs is a list of
+                (input_file, output_file) and conflicts a list of input files
+        """
+        jobs = []
+        conflicts = []
+        claimed = {}
+        seen_inputs = set()
+        
+        for input_file in input_files:
+            # The same file reached twice (e.g. a folder and a file inside it)
+            # isn't a clash; just drop the repeat
+            input_key = _path_key(input_file)
+            if input_key in seen_inputs:
+                continue
+            seen_inputs.add(input_key)
+            
+            output_file = self.output_path(input_file, output_dir)
+            key = _path_key(output_file)
+            
+            if key in claimed:
+                print(f"Error: {input_file} would overwrite the output of "
+                      f"{claimed[key]}: {output_file}")
+                conflicts.append(input_file)
+                continue
+            
+            claimed[key] = input_file
+            jobs.append((input_file, output_file))
+        
+        return jobs, conflicts
+    
+    def iter_convert(self, input_files, output_dir=None, extra_args=None, num_workers=None,
+                     force=False):
+        """
+        Convert multiple DOCX files in parallel, yielding results as they complete.
+        
+        Every file is an independent Pandoc process, so a thread pool is enough:
+        the threads spend their time waiting on the subprocess, not holding the GIL.
+        
+        Args:
+            input_files (list): List of paths to input DOCX files
+            output_dir (str, optional): Directory to save output files
+            extra_args (list, optional): Additional arguments to pass to Pandoc
+            num_workers (int, optional): Number of parallel conversions
+                (defaults to the number of CPUs)
+            force (bool, optional): Convert files even if their output is up to date
+            
+        Yields:
+            tuple: (input_file, status) in order of completion, where status is
+                CONVERTED, UP_TO_DATE or FAILED; inputs whose output path
+                clashes with an earlier input fail up front
+        """
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        
+        jobs, conflicts = self.plan_outputs(input_files, output_dir)
+        for input_file in conflicts:
+            yield input_file, FAILED
+        
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = {
+                executor.submit(self.convert_if_needed, input_file, output_file,
+                                extra_args, force): input_file
+                for input_file, output_file in jobs
+            }
+            
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                # If the caller stops early (Ctrl-C, an error, or closing the
+                # generator), drop queued conversions so only running ones finish
+                for future in futures:
+                    future.cancel()
+    
+    def batch_convert(self, input_files, output_dir=None, extra_args=None, num_workers=None,
+                      force=False):
         """
         Convert multiple DOCX files to Markdown.
         
@@ -85,79 +518,104 @@ class DocxToMarkdownConverter:
             input_files (list): List of paths to input DOCX files
             output_dir (str, optional): Directory to save output files
             extra_args (list, optional): Additional arguments to pass to Pandoc
+            num_workers (int, optional): Number of parallel conversions
+                (defaults to the number of CPUs)
+            force (bool, optional): Convert files even if their output is up to date
             
         Returns:
-            tuple: (successful_conversions, failed_conversions)
+            tuple: (successful_conversions, failed_conversions, up_to_date_files)
         """
         successful = []
         failed = []
+        up_to_date = []
         
-        for input_file in tqdm(input_files, desc="Converting files"):
-            if not input_file.lower().endswith('.docx'):
+        docx_files = []
+        seen = set()
+        for input_file in input_files:
+            if not _is_docx(input_file):
                 print(f"Skipping non-DOCX file: {input_file}")
                 continue
-                
-            if output_dir:
-                # Create output filename in the specified directory
-                filename = os.path.basename(input_file)
-                output_file = os.path.join(output_dir, os.path.splitext(filename)[0] + '.md')
-            else:
-                output_file = None  # Let convert_file determine the output path
             
-            if self.convert_file(input_file, output_file, extra_args):
+            # Convert a file listed more than once only once
+            key = _path_key(input_file)
+            if key in seen:
+                continue
+            seen.add(key)
+            docx_files.append(input_file)
+        
+        results = self.iter_convert(docx_files, output_dir, extra_args, num_workers, force)
+        for input_file, status in tqdm(results, total=len(docx_files), desc="Converting files"):
+            if status == CONVERTED:
                 successful.append(input_file)
+            elif status == UP_TO_DATE:
+                up_to_date.append(input_file)
             else:
                 failed.append(input_file)
         
-        return successful, failed
+        return successful, failed, up_to_date
 
 
-# Worker thread for conversion process
-class ConversionWorker(QThread):
+class ConversionSink(QObject):
+    """Collects the results of a job's ConversionTasks on the GUI thread."""
+    
+    file_converted = pyqtSignal(str, str)
     progress_updated = pyqtSignal(int)
-    status_updated = pyqtSignal(str)
-    conversion_complete = pyqtSignal(list, list)
-    error_occurred = pyqtSignal(str)
+    conversion_complete = pyqtSignal(list, list, list)
+    
+    def __init__(self, total_files):
+        super().__init__()
+        self.total_files = total_files
+        self.successful = []
+        self.failed = []
+        self.up_to_date = []
+        self.last_progress = 0
+        
+        # Tasks emit from pool threads; the sink lives on the GUI thread, so
+        # this connection is queued and the slot never runs concurrently
+        self.file_converted.connect(self._on_file_converted)
+    
+    def _on_file_converted(self, input_file, status):
+        if status == CONVERTED:
+            self.successful.append(input_file)
+        elif status == UP_TO_DATE:
+            self.up_to_date.append(input_file)
+        else:
+            self.failed.append(input_file)
+        
+        # Update progress only when the percentage changes, so a burst
+        # of completions doesn't flood the GUI with repaints
+        done = len(self.successful) + len(self.failed) + len(self.up_to_date)
+        progress = (done * 100) // self.total_files
+        if progress != self.last_progress:
+            self.progress_updated.emit(progress)
+            self.last_progress = progress
+        
+        if done == self.total_files:
+            self.conversion_complete.emit(self.successful, self.failed, self.up_to_date)
+
+
+# Converts one file on a QThreadPool thread
+class ConversionTask(QRunnable):
     
-    def __init__(self, converter, files, output_dir=None, extra_args=None):
+    def __init__(self, converter, input_file, output_file, extra_args, sink, force=False):
         super().__init__()
         self.converter = converter
-        self.files = files
-        self.output_dir = output_dir
+        self.input_file = input_file
+        self.output_file = output_file
         self.extra_args = extra_args
+        self.sink = sink
+        self.force = force
         
     def run(self):
+        status = FAILED
         try:
-            self.status_updated.emit("Converting files...")
-            total_files = len(self.files)
-            
-            successful = []
-            failed = []
-            
-            for i, input_file in enumerate(self.files):
-                # Update progress
-                progress = int((i / total_files) * 100)
-                self.progress_updated.emit(progress)
-                
-                if self.output_dir:
-                    # Create output filename in the specified directory
-                    filename = os.path.basename(input_file)
-                    output_file = os.path.join(self.output_dir, 
-                                             os.path.splitext(filename)[0] + '.md')
-                else:
-                    output_file = None  # Let convert_file determine the output path
-                
-                if self.converter.convert_file(input_file, output_file, self.extra_args):
-                    successful.append(input_file)
-                else:
-                    failed.append(input_file)
-            
-            # Set progress to 100% when done
-            self.progress_updated.emit(100)
-            self.conversion_complete.emit(successful, failed)
-            
+            status = self.converter.convert_if_needed(self.input_file, self.output_file,
+                                                      self.extra_args, self.force)
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            print(f"Exception while converting {self.input_file}: {str(e)}")
+        finally:
+            # QRunnable can't emit signals, so results go through the sink
+            self.sink.file_converted.emit(self.input_file, status)
 
 
 class DocxToMarkdownGUI(QMainWindow):
@@ -167,7 +625,14 @@ class DocxToMarkdownGUI(QMainWindow):
         super().__init__()
         self.converter = DocxToMarkdownConverter()
         self.selected_files = []
+        self._selected_set = set()  # Mirrors selected_files for fast membership tests
         self.output_directory = None
+        self.sink = None
+        
+        # Conversions run on Qt's shared thread pool, one task per file
+        self.thread_pool = QThreadPool.globalInstance()
+        self.thread_pool.setMaxThreadCount(os.cpu_count() or 1)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -236,6 +701,10 @@ class DocxToMarkdownGUI(QMainWindow):
         self.extra_args_edit = QLineEdit()
         options_layout.addRow("Extra Pandoc Args:", self.extra_args_edit)
         
+        # Reconvert files whose Markdown output is already up to date
+        self.force_checkbox = QCheckBox("Force reconvert")
+        options_layout.addRow("", self.force_checkbox)
+        
         main_layout.addWidget(options_group)
         
         # Convert button
@@ -273,11 +742,7 @@ class DocxToMarkdownGUI(QMainWindow):
         )
         
         if folder:
-            docx_files = []
-            for root, _, files in os.walk(folder):
-                for file in files:
-                    if file.lower().endswith('.docx'):
-                        docx_files.append(os.path.join(root, file))
+            docx_files = list(scan_docx_files(folder, recursive=True))
             
             if docx_files:
                 self.add_files(docx_files)
@@ -290,16 +755,30 @@ class DocxToMarkdownGUI(QMainWindow):
     
     def add_files(self, files):
         """Add files to the listbox and selected_files list."""
+        new_items = []
         for file in files:
-            if file not in self.selected_files:
+            if file not in self._selected_set:
                 self.selected_files.append(file)
-                self.files_list.addItem(os.path.basename(file))
+                self._selected_set.add(file)
+                new_items.append(os.path.basename(file))
+        
+        if new_items:
+            # Insert in one call, with repaints and sorting suspended until done
+            sorting = self.files_list.isSortingEnabled()
+            self.files_list.setUpdatesEnabled(False)
+            self.files_list.setSortingEnabled(False)
+            try:
+                self.files_list.addItems(new_items)
+            finally:
+                self.files_list.setSortingEnabled(sorting)
+                self.files_list.setUpdatesEnabled(True)
         
         self.statusBar().showMessage(f"{len(self.selected_files)} files selected")
     
     def clear_selection(self):
         """Clear the selected files."""
         self.selected_files = []
+        self._selected_set.clear()
         self.files_list.clear()
         self.statusBar().showMessage("Ready")
     
@@ -330,7 +809,11 @@ class DocxToMarkdownGUI(QMainWindow):
             
             # Create the output directory if it doesn't exist
             if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
+                try:
+                    os.makedirs(output_dir)
+                except OSError as e:
+                    self.handle_error(str(e))
+                    return
         
         extra_args = None
         if self.extra_args_edit.text().strip():
@@ -339,22 +822,32 @@ class DocxToMarkdownGUI(QMainWindow):
         # Disable UI elements during conversion
         self.set_ui_enabled(False)
         
-        # Start conversion in a worker thread
-        self.worker = ConversionWorker(
-            self.converter,
-            self.selected_files,
-            output_dir,
-            extra_args
-        )
+        force = self.force_checkbox.isChecked()
+        
+        # Inputs that would overwrite another file's output fail up front
+        jobs, conflicts = self.converter.plan_outputs(self.selected_files, output_dir)
+        
+        # Collect results on the GUI thread as the pool's tasks finish
+        self.sink = ConversionSink(len(jobs) + len(conflicts))
+        self.sink.progress_updated.connect(self.update_progress)
+        self.sink.conversion_complete.connect(self.conversion_finished)
+        
+        self.update_status("Converting files...")
+        self.update_progress(0)
         
-        # Connect signals
-        self.worker.progress_updated.connect(self.update_progress)
-        self.worker.status_updated.connect(self.update_status)
-        self.worker.conversion_complete.connect(self.conversion_finished)
-        self.worker.error_occurred.connect(self.handle_error)
+        for input_file in conflicts:
+            self.sink.file_converted.emit(input_file, FAILED)
         
-        # Start the worker
-        self.worker.start()
+        # Queue one conversion task per file
+        for input_file, output_file in jobs:
+            self.thread_pool.start(ConversionTask(
+                self.converter,
+                input_file,
+                output_file,
+                extra_args,
+                self.sink,
+                force
+            ))
     
     def update_progress(self, value):
         """Update the progress bar."""
@@ -364,7 +857,16 @@ class DocxToMarkdownGUI(QMainWindow):
         """Update the status bar."""
         self.statusBar().showMessage(message)
     
-    def conversion_finished(self, successful, failed):
+    def closeEvent(self, event):
+        """Shut down the converter when the window is closed."""
+        # Drop queued conversions and let running ones finish, so the server
+        # isn't shut down under them and no work outlives the window
+        self.thread_pool.clear()
+        self.thread_pool.waitForDone()
+        self.converter.close()
+        super().closeEvent(event)
+    
+    def conversion_finished(self, successful, failed, up_to_date):
         """Handle completion of the conversion process."""
         # Re-enable UI elements
         self.set_ui_enabled(True)
@@ -375,8 +877,16 @@ class DocxToMarkdownGUI(QMainWindow):
                 self,
                 "Conversion Results",
                 f"Converted {len(successful)} files successfully.\n"
+                f"{len(up_to_date)} files were already up to date.\n"
                 f"Failed to convert {len(failed)} files."
             )
+        elif up_to_date:
+            QMessageBox.information(
+                self,
+                "Conversion Complete",
+                f"Converted {len(successful)} files.\n"
+                f"{len(up_to_date)} files were already up to date."
+            )
         else:
             QMessageBox.information(
                 self,
@@ -384,7 +894,9 @@ class DocxToMarkdownGUI(QMainWindow):
                 f"Successfully converted all {len(successful)} files."
             )
         
-        self.statusBar().showMessage(f"Converted {len(successful)} files, {len(failed)} failed")
+        self.statusBar().showMessage(
+            f"Converted {len(successful)} files, {len(up_to_date)} up to date, {len(failed)} failed"
+        )
     
     def handle_error(self, error_message):
         """Handle errors during conversion."""
@@ -409,6 +921,18 @@ class DocxToMarkdownGUI(QMainWindow):
         self.files_list.setEnabled(enabled)
         self.output_dir_edit.setEnabled(enabled)
         self.extra_args_edit.setEnabled(enabled)
+        self.force_checkbox.setEnabled(enabled)
+
+
+def positive_int(value):
+    """argparse type for options that need a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
 
 
 def parse_arguments():
@@ -432,6 +956,22 @@ def parse_arguments():
         help="Recursively search for DOCX files in directories"
     )
     
+    parser.add_argument(
+        "-j", "--jobs", type=positive_int,
+        help="Number of files to convert in parallel (default: number of CPUs)"
+    )
+    
+    parser.add_argument(
+        "--server", action="store_true",
+        help="Convert through one persistent 'pandoc server' process (Pandoc 3.0+). "
+             "The server listens on all network interfaces while it runs"
+    )
+    
+    parser.add_argument(
+        "-f", "--force", action="store_true",
+        help="Reconvert files even if their Markdown output is up to date"
+    )
+    
     parser.add_argument(
         "-g", "--gui", action="store_true",
         help="Launch the graphical user interface"
@@ -445,6 +985,41 @@ def parse_arguments():
     return parser.parse_args()
 
 
+def scan_docx_files(directory, recursive=False):
+    """
+    Yield the DOCX files in a directory.
+    
+    Uses os.scandir, whose entries already know whether they are files or
+    directories, so most entries need no extra stat call. Like os.walk,
+    symlinked files are included but symlinked directories aren't followed.
+    
+    Args:
+        directory (str): Directory to search
+        recursive (bool): Whether to search subdirectories
+        
+    Yields:
+        str: Path to each DOCX file found
+    """
+    stack = [directory]
+    
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        if _is_docx(entry.name):
+                            yield entry.path
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                except OSError:
+                    continue
+
+
 def find_docx_files(paths, recursive=False):
     """
     Find DOCX files in the given paths.
@@ -453,30 +1028,28 @@ def find_docx_files(paths, recursive=False):
         paths (list): List of file or directory paths
         recursive (bool): Whether to search directories recursively
         
-    Returns:
-        list: List of DOCX file paths
+    Yields:
+        str: Path to each DOCX file found, once even if several paths reach it
     """
-    docx_files = []
+    # Look up the working directory once rather than in every abspath call
+    cwd = os.getcwd()
+    seen = set()
     
     for path in paths:
-        path = os.path.abspath(path)
+        path = os.path.normpath(os.path.join(cwd, path))
         
         if os.path.isfile(path):
-            if path.lower().endswith('.docx'):
-                docx_files.append(path)
+            found = [path] if _is_docx(path) else []
         elif os.path.isdir(path):
-            if recursive:
-                for root, _, files in os.walk(path):
-                    for file in files:
-                        if file.lower().endswith('.docx'):
-                            docx_files.append(os.path.join(root, file))
-            else:
-                for file in os.listdir(path):
-                    file_path = os.path.join(path, file)
-                    if os.path.isfile(file_path) and file.lower().endswith('.docx'):
-                        docx_files.append(file_path)
-    
-    return docx_files
+            found = scan_docx_files(path, recursive)
+        else:
+            continue
+        
+        for docx_file in found:
+            key = _path_key(docx_file)
+            if key not in seen:
+                seen.add(key)
+                yield docx_file
 
 
 def main():
@@ -491,12 +1064,14 @@ def main():
         sys.exit(app.exec_())
         return
     
+    converter = None
     try:
-        converter = DocxToMarkdownConverter()
+        converter = DocxToMarkdownConverter(use_server=args.server)
         
         # Find DOCX files
         if args.files:
-            docx_files = find_docx_files(args.files, args.recursive)
+            # Collected up front so the total is known for reporting and progress
+            docx_files = list(find_docx_files(args.files, args.recursive))
         else:
             print("No files specified. Use --gui to launch the GUI or specify files to convert.")
             return
@@ -508,14 +1083,17 @@ def main():
         print(f"Found {len(docx_files)} DOCX files to convert.")
         
         # Convert files
-        successful, failed = converter.batch_convert(
-            docx_files, args.output_dir, args.pandoc_args
+        successful, failed, up_to_date = converter.batch_convert(
+            docx_files, args.output_dir, args.pandoc_args, args.jobs, args.force
         )
         
         # Print results
         print(f"\nConversion complete:")
         print(f"  - Successfully converted: {len(successful)} files")
         
+        if up_to_date:
+            print(f"  - Already up to date: {len(up_to_date)} files")
+        
         if failed:
             print(f"  - Failed to convert: {len(failed)} files")
             for file in failed:
@@ -524,6 +1102,9 @@ def main():
     except Exception as e:
         print(f"Error: {str(e)}")
         return 1
+    finally:
+        if converter is not None:
+            converter.close()
     
     return 0
 